@@ -1,11 +1,12 @@
 __version__ = '0.0.0'
 
 import os
+import csv
 import datetime
 
 
 class FailSampler(object):
-    def __init__(self, save_dir=os.path.join(os.getcwd(), 'fail_samples'), save_filename=None, sample_method='random', sample_size=None, random_state=None):
+    def __init__(self, save_dir=None, save_filename=None, sample_method='random', sample_size=None, random_state=None, fast_csv=False):
         sample_method = sample_method.lower()
         if sample_method not in ['random', 'head', 'tail']:
             raise ValueError("`sample_method` must be one of 'random', 'head', or 'tail'")
@@ -14,6 +15,7 @@ class FailSampler(object):
         self.random_state = random_state
         self.save_dir = save_dir
         self.save_filename = save_filename
+        self.fast_csv = fast_csv
     
     def take_sample(self, df, fails_index):
         fails = df[fails_index]
@@ -27,10 +29,63 @@ class FailSampler(object):
             return fails.head(self.sample_size)
     
     def write_sample(self, df, fails_index, save_dir=None, save_filename=None, *args, **kwargs):
-        save_dir = save_dir or self.save_dir
+        save_dir = save_dir or self.save_dir or os.path.join(os.getcwd(), 'fail_samples')
         save_filename = save_filename or self.save_filename or 'FailSample {dt}'.format(dt=datetime.datetime.now().strftime("%Y-%m-%d-%H%M%s"))
         save_path = os.path.join(save_dir, save_filename)
-        self.take_sample(df, fails_index).to_csv(save_path, *args, **kwargs)
+        sample = self.take_sample(df, fails_index)
+        # the fast writer only covers `sep` and `index`, and values whose str() matches `to_csv` output
+        index = kwargs.get('index', True)
+        if self.fast_csv and not args and set(kwargs) <= {'sep', 'index'} and self.can_write_csv(sample, index=index):
+            self.write_csv(sample, save_path, sep=kwargs.get('sep', ','), index=index)
+        else:
+            sample.to_csv(save_path, *args, **kwargs)
+    
+    @staticmethod
+    def can_write_csv(df, index=True):
+        """
+        Return True if `write_csv` writes dataframe (or series) `df` exactly like `to_csv` would: 
+        all columns (and index levels, if `index`) hold booleans, numbers, strings, or categories of those.
+        Dates and times are excluded, because `to_csv` shortens them (e.g. '2020-01-01' rather than '2020-01-01 00:00:00'), 
+        and so are floats narrower than 64 bits, which `to_csv` writes at their own precision (0.1 rather than 0.10000000149011612).
+        Multi-level columns are excluded, because `to_csv` writes one header row per level.
+        """
+        if hasattr(df, 'columns') and df.columns.nlevels > 1:
+            return False
+        dtypes = list(df.dtypes) if hasattr(df, 'columns') else [df.dtype]
+        if index:
+            dtypes += [df.index.get_level_values(i).dtype for i in range(df.index.nlevels)]
+        for dtype in dtypes:
+            categories = getattr(dtype, 'categories', None)
+            if categories is not None:
+                dtype = categories.dtype
+            if dtype.kind not in 'biufO' or (dtype.kind == 'f' and dtype.itemsize < 8):
+                return False
+        return True
+    
+    @staticmethod
+    def write_csv(df, save_path, sep=',', index=True):
+        """
+        Write dataframe (or series) `df` to `save_path` in UTF-8 with the `csv` module, 
+        which skips most of the per-value formatting work done by `DataFrame.to_csv`.
+        Only `sep` and `index` are supported; missing values are written as empty fields, like `to_csv`.
+        Raise ValueError if `df` holds values `to_csv` would format differently; see `can_write_csv`.
+        """
+        if not FailSampler.can_write_csv(df, index=index):
+            raise ValueError('`df` has columns write_csv cannot format like to_csv; use to_csv instead')
+        if not hasattr(df, 'columns'):
+            df = df.to_frame()
+        header = list(df.columns)
+        rows = df.astype(object).where(df.notna(), '').itertuples(index=False, name=None)
+        if index:
+            # prepend index values per row rather than reset_index(), which fails when index names clash with columns
+            header = ['' if name is None else name for name in df.index.names] + header
+            levels = [df.index.get_level_values(i) for i in range(df.index.nlevels)]
+            levels = [level.astype(object).where(level.notna(), '') for level in levels]
+            rows = (keys + row for keys, row in zip(zip(*levels), rows))
+        with open(save_path, 'w', newline='', encoding='utf-8', buffering=1<<20) as f:
+            writer = csv.writer(f, delimiter=sep, lineterminator=os.linesep)
+            writer.writerow(header)
+            writer.writerows(rows)
 
 
 class DataFrameInspector(object):
@@ -46,13 +101,48 @@ class DataFrameInspector(object):
         Title::status::detail::extra
         Any None will be skipped.
         """
-        strings = [self.title, status, self.detail, extra]
-        return sep.join(filter(None, strings))
+        return sep.join([s for s in (self.title, status, self.detail, extra) if s])
+    
+    def plan(self, cache):
+        """
+        Record in `cache` the work this inspector will need, before any inspector of a `QARoutine` run inspects the dataframe, 
+        so that `shared_inputs()` can do it once for all inspectors that need it.
+        """
+        pass
+    
+    def shared_inputs(self, df, cache):
+        """
+        Return keyword arguments for `inspect()` that can be shared with other inspectors run on the same dataframe.
+        `cache` is a dict shared by all inspectors of a `QARoutine` run; store reusable intermediate results in it.
+        """
+        return {}
     
-    def inspect(self, df):
+    def inspect(self, df, df_desc=None, **kwargs):
         pass
 
         
 
 class QARoutine(object):
-    pass
\ No newline at end of file
+    def __init__(self, inspectors=None):
+        self.inspectors = list(inspectors) if inspectors else []
+    
+    def add(self, inspector):
+        self.inspectors.append(inspector)
+        return self
+    
+    def run(self, df, df_desc=None):
+        """
+        Run all inspectors on dataframe `df`, and return a list of their results in the order the inspectors were added.
+        Inspectors share intermediate results through `DataFrameInspector.shared_inputs()`, 
+        e.g. one `df.isna()` for all missing values checks, one `df.groupby(by)` for all group checks with the same `by`, 
+        and one regex scan for all column format checks on the same column.
+        """
+        cache = {}
+        for inspector in self.inspectors:
+            inspector.plan(cache)
+        results = []
+        for inspector in self.inspectors:
+            # only pass shared inputs to inspectors that ask for them, so subclasses need not accept extra keywords
+            shared = inspector.shared_inputs(df, cache)
+            results.append(inspector.inspect(df, df_desc=df_desc, **shared) if shared else inspector.inspect(df, df_desc=df_desc))
+        return results
\ No newline at end of file
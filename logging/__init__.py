@@ -1,8 +1,24 @@
+def log_msg_parts(title, status, detail=None, extra=None):
+    """
+    Return the non-empty parts of a log message, in the order
+    [title, status, detail, extra]. Join them with a separator to make a message.
+    """
+    return [s for s in (title, status, detail, extra) if s]
+
 def make_log_msg(title, status, detail=None, extra=None, sep='::'):
     """
     Make a message that looks like this:
     Title::status::detail::extra
     Any None will be skipped.
     """
-    strings = [title, status, detail, extra]
-    return sep.join(filter(None, strings))
+    return sep.join(log_msg_parts(title, status, detail, extra))
+
+def emit_log_msg(logger, level, parts, sep='::'):
+    """
+    Log the message made of `parts` (see `log_msg_parts`) to `logger` at `level`, or print it if `logger` is None.
+    The message string is only built if `logger` is enabled for `level`.
+    """
+    if logger is None:
+        print(sep.join(parts))
+    elif logger.isEnabledFor(level):
+        logger.log(level, sep.join(parts), stacklevel=2)
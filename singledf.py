@@ -1,14 +1,180 @@
 import os
+import re
 import logging
+from functools import lru_cache
 
 import pandas as pd
 import numpy as np
-from .logging import make_log_msg
+from .logging import log_msg_parts, emit_log_msg
 from . import DataFrameInspector, FailSampler
 
-def check_col_format(df, col, regex, df_desc=None, inspector_title='check_col_format', inspection_detail=None, logger=None, fail_sampler=None):
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Minimum number of values for which comparing with the Numba kernel beats numpy.isclose()
+_NUMBA_ISCLOSE_MIN_SIZE = 1000000
+
+if numba is not None:
+    @numba.njit(parallel=True)
+    def _isclose_scalar_kernel(a, val, rtol, atol, out):
+        for i in numba.prange(a.size):
+            out[i] = abs(a[i] - val) <= atol + rtol * abs(val)
+
+
+def _isclose(values, val, rtol=1e-05, atol=1e-08, equal_nan=False):
+    """
+    numpy.isclose(values, val, ...) for a 1-D array `values` and a scalar `val`.
+    Large numeric arrays are compared in a single fused Numba loop when Numba is installed, 
+    which avoids the temporary arrays numpy.isclose() allocates.
+    """
+    values = np.asarray(values)
+    if (numba is None or values.size < _NUMBA_ISCLOSE_MIN_SIZE or equal_nan or values.ndim != 1
+            or values.dtype.kind not in 'iuf' or not np.isscalar(val) or not np.isfinite(val)):
+        return np.isclose(values, val, rtol=rtol, atol=atol, equal_nan=equal_nan)
+    out = np.empty(values.size, dtype=bool)
+    _isclose_scalar_kernel(values, float(val), float(rtol), float(atol), out)
+    return out
+
+def _anchored(pattern):
+    """
+    Return the source of `pattern` (a `re.Pattern`) anchored at the start of a string, like `re.match`,
+    for use with other regex engines. Return None if the pattern is bytes or uses flags other engines would ignore.
+    """
+    if not isinstance(pattern.pattern, str) or pattern.flags & ~re.UNICODE:
+        return None
+    return '^(?:{})'.format(pattern.pattern)
+
+# `\Z` and `{,n}` (not preceded by an escaping backslash), which Hyperscan does not read like Python `re`
+_HYPERSCAN_DIVERGENT = re.compile(r'(?<!\\)(?:\\\\)*(?:\\Z|\{,)')
+
+@lru_cache(maxsize=128)
+def _hyperscan_db(*patterns):
+    """
+    Compile `patterns` (`re.Pattern`s) into one Hyperscan database that matches at the start of a string, like `re.match`.
+    Each pattern's matches are reported with its position in `patterns` as id.
+    Return None if Hyperscan is not installed, or if any pattern uses flags or syntax Hyperscan cannot handle.
+    Patterns using `\\Z` or `{,n}` are also rejected: Hyperscan reads them differently from Python `re`
+    (PCRE `\\Z` also matches before a trailing newline, and `{,n}` is taken literally).
+    """
+    expressions = [_anchored(pattern) for pattern in patterns]
+    if hyperscan is None or None in expressions or any(_HYPERSCAN_DIVERGENT.search(e) for e in expressions):
+        return None
+    db = hyperscan.Database()
+    flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    try:
+        db.compile(expressions=[e.encode() for e in expressions], ids=list(range(len(patterns))), flags=[flags]*len(patterns))
+    except Exception:
+        return None
+    return db
+
+def _hyperscan_match(db, strings, n_patterns):
+    """
+    Scan every element of `strings` once with Hyperscan database `db` compiled from `n_patterns` patterns.
+    Return a boolean np.ndarray of shape (n_patterns, len(strings)), or None if a string cannot be encoded as UTF-8 (e.g. lone surrogates).
+    """
+    ok = np.zeros((n_patterns, len(strings)), dtype=bool)
+    def on_match(id, start, end, flags, context):
+        ok[id, context] = True
+    for i, s in enumerate(strings.to_numpy(dtype=object)):
+        try:
+            data = s.encode()
+        except UnicodeEncodeError:
+            return None
+        db.scan(data, match_event_handler=on_match, context=i)
+    return ok
+
+def _arrow_match(strings, pattern):
+    """
+    Match `strings` against `pattern` with PyArrow's RE2-based `match_substring_regex`, 
+    which scans the contiguous string buffer without Python-level iteration. 
+    Arrow-backed string columns are used without conversion.
+    RE2 differs from Python `re`: `\\d`, `\\w`, `\\s` and `\\b` are ASCII-only, and `$` does not match before a trailing newline.
+    Return a boolean np.ndarray, or None if PyArrow is not installed or RE2 does not support the pattern.
+    """
+    expression = _anchored(pattern)
+    if pa is None or expression is None:
+        return None
+    try:
+        ok = pc.match_substring_regex(pa.array(strings), expression)
+    except pa.ArrowInvalid:
+        return None
+    return ok.to_numpy(zero_copy_only=False)
+
+def _match_strings(strings, pattern, use_re2=False, use_hyperscan=False):
+    """
+    Match every element of `strings` (a pd.Series of str) against `pattern` from the start of the string.
+    Return a boolean np.ndarray.
+    Matches with pandas `.str.match` (Python `re`) by default.
+    With `use_hyperscan` or `use_re2`, Hyperscan or PyArrow (RE2) is tried first; both can give different results than Python `re`.
+    """
+    db = _hyperscan_db(pattern) if use_hyperscan else None
+    ok = _hyperscan_match(db, strings, 1) if db is not None else None
+    if ok is not None:
+        return ok[0]
+    ok = _arrow_match(strings, pattern) if use_re2 else None
+    if ok is not None:
+        return ok
+    # Arrow-backed `.str.match` does not accept compiled patterns; `strings` only holds distinct values, so converting is cheap
+    return strings.astype(object).str.match(pattern).to_numpy(dtype=bool)
+
+def _holds_only_strings(s):
+    """
+    Return True if pd.Series `s` holds only str values (no missing values), so it can be matched without `astype(str)`.
+    """
+    if isinstance(s.dtype, pd.StringDtype) or (pa is not None and isinstance(s.dtype, getattr(pd, 'ArrowDtype', ())) and pa.types.is_string(s.dtype.pyarrow_dtype)):
+        return not s.hasnans
+    return s.dtype == object and pd.api.types.infer_dtype(s, skipna=False) == 'string'
+
+def _distinct_strings(s):
+    """
+    Return `(strings, codes)` for column `s` (a pd.Series), where `strings` holds the distinct values of `s` 
+    as `s.astype(str)` would convert them, and `strings[codes]` gives back every row.
+    """
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # missing values have code -1, which picks the trailing 'nan' entry, same as astype(str)
+        strings = pd.Series(s.cat.categories.astype(str).tolist() + [str(np.nan)])
+        return strings, s.cat.codes.to_numpy()
+    # Other values are converted before factorizing: values that compare equal can still print differently (1 and 1.0, True and 1)
+    codes, uniques = pd.factorize(s if _holds_only_strings(s) else s.astype(str), sort=False)
+    return pd.Series(uniques), codes
+
+def _match_col(s, patterns, use_re2=False, use_hyperscan=False):
+    """
+    Match column `s` (a pd.Series) against each of `patterns` as if it had been converted by `s.astype(str)`.
+    Return a boolean np.ndarray of shape (len(patterns), len(s)).
+    Only the distinct values of the column are converted and matched, and the results are gathered back to rows by their codes,
+    so a low-cardinality column costs far fewer regex matches than it has rows.
+    Several patterns on the same column share one pass: a single multi-pattern Hyperscan scan with `use_hyperscan`.
+    """
+    strings, codes = _distinct_strings(s)
+    db = _hyperscan_db(*patterns) if use_hyperscan and len(patterns) > 1 else None
+    unique_ok = _hyperscan_match(db, strings, len(patterns)) if db is not None else None
+    if unique_ok is None:
+        unique_ok = np.vstack([_match_strings(strings, pattern, use_re2=use_re2, use_hyperscan=use_hyperscan) for pattern in patterns])
+    return unique_ok[:, codes]
+
+def check_col_format(df, col, regex, df_desc=None, inspector_title='check_col_format', inspection_detail=None, logger=None, fail_sampler=None, matched=None, use_re2=False, use_hyperscan=False):
     """
     Check if all elements of column `col` in dataframe `df` match `regex`.
+    `regex` can be a pattern string or a pre-compiled `re.Pattern`.
+    `matched` can be a precomputed boolean array of which rows match `regex`, e.g. from one scan shared by several checks on `col`.
+    `use_re2` lets PyArrow's RE2 engine match when it is installed. RE2 is faster but its `\\d`, `\\w`, `\\s` and `\\b` are ASCII-only
+    and its `$` does not match before a trailing newline, so results can differ from Python `re`.
+    `use_hyperscan` lets Hyperscan match when it is installed. It also differs from Python `re` (e.g. its `\\s` does not match '\\x1c'-'\\x1f'),
+    and scanning row by row from Python is usually slower than pandas for simple patterns.
     If check is OK, log an INFO message to logger, and return True.
     If check fails, log an ERROR message to logger, write failed records via `file_sampler`, and return False.
     """
@@ -16,98 +182,126 @@ def check_col_format(df, col, regex, df_desc=None, inspector_title='check_col_fo
         msg = 'Column {} not found in dataframe'.format(col) + (' '+df_desc if df_desc else '')
         logger.warning(msg) if logger else print(msg)
     
-    inspection_detail = inspection_detail or 'Column {} vs. pattern {}'.format(col, regex)
-    ok = df[col].astype(str).str.match(regex)
+    pattern = regex if isinstance(regex, re.Pattern) else re.compile(regex)
+    inspection_detail = inspection_detail or 'Column {} vs. pattern {}'.format(col, pattern.pattern)
+    matched = matched if matched is not None else _match_col(df[col], [pattern], use_re2=use_re2, use_hyperscan=use_hyperscan)[0]
+    bad = pd.Series(~matched, index=df.index)
     
-    if ok.all():
-        msg = make_log_msg(inspector_title, status='PASS', detail=inspection_detail, extra=df_desc)
-        logger.info(msg) if logger else print(msg)
+    if not bad.any():
+        emit_log_msg(logger, logging.INFO, log_msg_parts(inspector_title, status='PASS', detail=inspection_detail, extra=df_desc))
         return True
     else:
         # fail info
-        nrows = sum(~ok)
+        nrows = int(bad.sum())
         inspection_detail += ' {} violations'.format(nrows)
-        msg = make_log_msg(inspector_title, status='FAIL', detail=inspection_detail, extra=df_desc)
-        fail_sample_filename = make_log_msg(inspector_title, status='FAIL', detail=inspection_detail, extra=df_desc, sep=' ')
+        msg_parts = log_msg_parts(inspector_title, status='FAIL', detail=inspection_detail, extra=df_desc)
+        fail_sample_filename = ' '.join(msg_parts)
         # log error
-        logger.error(msg) if logger else print(msg)
+        emit_log_msg(logger, logging.ERROR, msg_parts)
         # write fail sample
-        fail_sampler.write_sample(df, ~ok, save_filename=fail_sample_filename, index=False) if fail_sampler else None
+        fail_sampler.write_sample(df, bad, save_filename=fail_sample_filename, index=False) if fail_sampler else None
         return False
 
-def check_missing_values(df: pd.DataFrame, cols=None, df_desc=None, inspector_title='check_missing_values', inspection_detail=None, logger=None, fail_sampler=None):
+def check_missing_values(df: pd.DataFrame, cols=None, df_desc=None, inspector_title='check_missing_values', inspection_detail=None, logger=None, fail_sampler=None, null_mask=None):
     """
     Check if dataframe `df` has missing values in columns `cols`, or check all columns if `cols` is None. 
     If no missing values found, log INFO to logger and return True.
     If missing values found, log ERROR to logger, and return False.
+    `null_mask` can be a precomputed `df.isna()` covering `cols`, e.g. shared by several checks on the same dataframe.
     """
     cols = cols if cols else df.columns.tolist()
-    ok = df[cols].isnull().sum(axis=0)==0  # ok should be a pd.Series with column names as index and True/False indicating if the column is ok.
-    if all(ok):
+    null_mask = null_mask[cols] if null_mask is not None else df[cols].isna()  # computed once, reused for the fail sample
+    bad = null_mask.any(axis=0)  # bad should be a pd.Series with column names as index and True/False indicating if the column has missing values.
+    if not bad.any():
         inspection_detail = inspection_detail or 'No missing values in {}'.format(cols)
-        msg = make_log_msg(inspector_title, status='PASS', detail=inspection_detail, extra=df_desc)
-        logger.info(msg) if logger else print(msg)
+        emit_log_msg(logger, logging.INFO, log_msg_parts(inspector_title, status='PASS', detail=inspection_detail, extra=df_desc))
         return True
     else:
         # fail info
-        fail_cols = ok[~ok].index.tolist() # a list of cols that has missing values
+        fail_cols = bad[bad].index.tolist() # a list of cols that has missing values
         inspection_detail = inspection_detail or 'Missing values found in columns {}'.format(fail_cols)
-        msg = make_log_msg(inspector_title, status='FAIL', detail=inspection_detail, extra=df_desc)
-        fail_sample_filename = make_log_msg(inspector_title, status='FAIL', detail=inspection_detail, extra=df_desc, sep=' ')
+        msg_parts = log_msg_parts(inspector_title, status='FAIL', detail=inspection_detail, extra=df_desc)
+        fail_sample_filename = ' '.join(msg_parts)
         # log error msg
-        logger.error(msg) if logger else None
+        emit_log_msg(logger, logging.ERROR, msg_parts) if logger else None
         # make fail sample
-        fail_index = df[fail_cols].isnull().any(axis=1)
+        fail_index = null_mask.loc[:, bad].to_numpy().any(axis=1)
         fail_sampler.write_sample(df, fail_index, save_filename=fail_sample_filename, index=False) if fail_sampler else None
         return False
 
-def check_groupby_agg(df, by, check_col, agg_func, desired_agg_val=True, almost_equal=False, agg_func_name='infer', compare_tolerance={}, df_desc=None, inspector_title=None, inspection_detail=None, logger=None, fail_sampler=None):
+def check_groupby_agg(df, by, check_col, agg_func, desired_agg_val=True, almost_equal=False, agg_func_name='infer', compare_tolerance={}, df_desc=None, inspector_title=None, inspection_detail=None, logger=None, fail_sampler=None, groupby=None):
     """
     df.groupby(by)[check_col].agg(agg_func) should all equal to `desired_agg_val`.
     If so, log INFO message to logger, and return True.
     If not, log ERROR message to logger, write a fail sample via `file_sampler`, and return False.
     When `almost_equal` is set to True, use numpy.isclose() rather than exact comparison. `compare_tolerance` is passed to numpy.isclose() as keyword arguments. 
+    `groupby` can be a precomputed `df.groupby(by)` object, e.g. shared by several checks grouping by the same keys.
+    Groups are formed with `sort=False, observed=True`: pass/fail does not depend on group order, and unobserved categories are not checked.
     """
     # Prepare info about this check
     title = inspector_title or 'Group Aggregate Check'
     agg_func_name = agg_func.__name__ if agg_func_name=='infer' and hasattr(agg_func, '__name__') else str(agg_func_name)
     inspection_detail = inspection_detail or '{col} grouped by {by} aggregated by {func} compared with {val}'.format(col=check_col, by=by, func=agg_func_name, val=desired_agg_val)
     # Group & aggregate
-    gb_agg = df.groupby(by)[check_col].agg(agg_func) if check_col else df.groupby(by).agg(agg_func)
-    ok = gb_agg.apply(lambda x: np.isclose(x, desired_agg_val, **compare_tolerance)) if almost_equal else gb_agg==desired_agg_val
-    
-    if ok.all():
-        msg = make_log_msg(title, status='PASS', detail=inspection_detail, extra=df_desc)
-        logger.info(msg) if logger else print(msg)
+    gb = groupby if groupby is not None else df.groupby(by, sort=False, observed=True)
+    gb_agg = gb[check_col].agg(agg_func) if check_col else gb.agg(agg_func)
+    if almost_equal:
+        ok = pd.Series(_isclose(gb_agg.to_numpy(), desired_agg_val, **compare_tolerance), index=gb_agg.index)
+    else:
+        ok = gb_agg.eq(desired_agg_val)
+    return _report_group_check(gb_agg, ok, title=title, inspection_detail=inspection_detail, df_desc=df_desc, logger=logger, fail_sampler=fail_sampler)
+
+def _report_group_check(gb_agg, ok, title, inspection_detail, df_desc=None, logger=None, fail_sampler=None):
+    """
+    Log the result of a group-wise check, where `ok` flags which groups of the aggregate `gb_agg` passed.
+    Return True if all groups passed, otherwise write the failed groups via `fail_sampler` and return False.
+    """
+    bad = ~ok
+    if not bad.any():
+        emit_log_msg(logger, logging.INFO, log_msg_parts(title, status='PASS', detail=inspection_detail, extra=df_desc))
         return True
     else:
         # fail info
-        n_not_ok = sum(~ok)
+        n_not_ok = int(bad.sum())
         inspection_detail += ' {} violations'.format(n_not_ok)
-        msg = make_log_msg(title, status='FAIL', detail=inspection_detail, extra=df_desc)
-        fail_sample_filename = make_log_msg(title, status='FAIL', detail=inspection_detail, extra=df_desc, sep=' ')
+        msg_parts = log_msg_parts(title, status='FAIL', detail=inspection_detail, extra=df_desc)
+        fail_sample_filename = ' '.join(msg_parts)
         # log error
-        logger.error(msg) if logger else print(msg)
-        # make fail sample
-        fail_sampler.write_sample(gb_agg, ~ok, save_filename=fail_sample_filename) if fail_sampler else None
+        emit_log_msg(logger, logging.ERROR, msg_parts)
+        # make fail sample, with group keys as columns rather than a (Multi)Index
+        if fail_sampler:
+            if gb_agg.ndim == 1 and gb_agg.name in gb_agg.index.names:
+                # the aggregated column is also a group key, e.g. counting a key column grouped by itself
+                sample = gb_agg.reset_index(name='{}_agg'.format(gb_agg.name))
+            else:
+                sample = gb_agg.reset_index()
+            fail_sampler.write_sample(sample, bad.to_numpy(), save_filename=fail_sample_filename, index=False)
         return False
 
-def check_groupby_identical(df: pd.DataFrame, by, check_col, tolerance=None, df_desc=None, inspector_title='check_group_identical', inspection_detail=None, logger=None, fail_sampler=None):
+def check_groupby_identical(df: pd.DataFrame, by, check_col, tolerance=None, df_desc=None, inspector_title='check_group_identical', inspection_detail=None, logger=None, fail_sampler=None, groupby=None):
     """
     df.groupby(by)[check_col] should be identical within each group.
     If so, log INFO message to logger, and return True.
     If not, log ERROR message to logger, write a fail sample via `file_sampler`, and return False.
+    Without `tolerance`, groups are compared by their number of unique values (missing values count as one value).
+    With `tolerance`, the within-group range (max - min) is compared with 0 by numpy.isclose(), using `tolerance` as keyword arguments.
+    In both modes a group mixing missing and non-missing values fails, and a group of only missing values passes.
+    `groupby` can be a precomputed `df.groupby(by)` object, e.g. shared by several checks grouping by the same keys.
+    Groups are formed with `sort=False, observed=True`: pass/fail does not depend on group order, and unobserved categories are not checked.
     """
     # Info about this check
     inspection_detail = inspection_detail or '{col} grouped by {by} is identical within group?'.format(col=check_col, by=by)
-    check_groupby_agg(df=df, by=by, check_col=check_col, 
-                      agg_func=np.ptp,
-                      desired_agg_val=0,
-                      almost_equal=bool(tolerance),
-                      compare_tolerance=tolerance,
-                      df_desc=df_desc,
-                      inspector_title=inspector_title, inspection_detail=inspection_detail, 
-                      logger=logger, fail_sampler=fail_sampler)
+    # Use pandas' built-in group reductions rather than a Python function called per group
+    gb = (groupby if groupby is not None else df.groupby(by, sort=False, observed=True))[check_col]
+    if tolerance:
+        gb_agg = gb.max() - gb.min()  # max/min skip missing values, so check those separately
+        n_valid = gb.count().to_numpy()
+        all_valid = n_valid == gb.size().to_numpy()
+        ok = pd.Series((n_valid == 0) | (all_valid & _isclose(gb_agg.to_numpy(), 0, **tolerance)), index=gb_agg.index)
+    else:
+        gb_agg = gb.nunique(dropna=False)
+        ok = gb_agg.le(1)
+    return _report_group_check(gb_agg, ok, title=inspector_title, inspection_detail=inspection_detail, df_desc=df_desc, logger=logger, fail_sampler=fail_sampler)
 
 def check_no_duplicate(df, cols=None, df_desc=None, inspector_title='check_no_duplicate', inspection_detail=None, logger=None, fail_sampler=None):
     """
@@ -115,35 +309,72 @@ def check_no_duplicate(df, cols=None, df_desc=None, inspector_title='check_no_du
     If so, log INFO message to logger, and return True.
     If not, log ERROR message to logger, write a fail sample via file_sampler, and return False.
     """
-    dup = df.duplicated(subset=cols, keep=False)
-    if not any(dup):
+    # A single hash aggregation gives both pass/fail and the violation count; 
+    # on failure the row-level mask is gathered from the same groups instead of calling df.duplicated().
+    by = cols if cols is not None else df.columns.tolist()
+    gb = df.groupby(by, sort=False, observed=True, dropna=False)
+    grp_sizes = gb.size().to_numpy()
+    dup_groups = grp_sizes > 1
+    if not dup_groups.any():
         inspection_detail = 'No duplicate in combinations of {}'.format(cols)
-        msg = make_log_msg(title=inspector_title, status='PASS', detail=inspection_detail, extra=df_desc)
-        logger.info(msg) if logger else print(msg)
+        emit_log_msg(logger, logging.INFO, log_msg_parts(inspector_title, status='PASS', detail=inspection_detail, extra=df_desc))
         return True
     else:
         # fail info
-        n_not_ok = sum(dup)
+        n_not_ok = int(grp_sizes[dup_groups].sum())
         inspection_detail = 'Duplicates found in cols {} {} violations'.format(cols, n_not_ok)
-        msg = make_log_msg(title=inspector_title, status='FAIL', detail=inspection_detail, extra=df_desc)
-        fail_sample_filename = make_log_msg(inspector_title, status='FAIL', detail=inspection_detail, extra=df_desc, sep=' ')
+        msg_parts = log_msg_parts(inspector_title, status='FAIL', detail=inspection_detail, extra=df_desc)
+        fail_sample_filename = ' '.join(msg_parts)
         # log error
-        logger.error(msg) if logger else print(msg)
+        emit_log_msg(logger, logging.ERROR, msg_parts)
         # write fail sample
-        fail_sampler.write_sample(df, dup, save_filename=fail_sample_filename, index=False) if fail_sampler else None
+        if fail_sampler:
+            dup = dup_groups[gb.ngroup().to_numpy()]
+            fail_sampler.write_sample(df, dup, save_filename=fail_sample_filename, index=False)
+        return False
+
+def _cached_groupby(df, by, cache):
+    """
+    Return `df.groupby(by)`, reusing the groupby object stored in `cache` by an earlier inspector with the same `by`.
+    Groupers that cannot be cache keys, such as arrays or Series, are not cached.
+    """
+    key = ('groupby', tuple(by) if isinstance(by, list) else by)
+    try:
+        hash(key)
+    except TypeError:
+        return df.groupby(by, sort=False, observed=True)
+    if key not in cache:
+        cache[key] = df.groupby(by, sort=False, observed=True)
+    return cache[key]
 
 
 class ColumnFormatInspector(DataFrameInspector):
-    def __init__(self, col, regex, title='Column Format Check', detail=None, logger=None, fail_sampler=None):
+    def __init__(self, col, regex, title='Column Format Check', detail=None, logger=None, fail_sampler=None, use_re2=False, use_hyperscan=False):
         detail = detail or 'Column {} vs. pattern {}'.format(col, regex)
         super().__init__(title, detail=detail, logger=logger, fail_sampler=fail_sampler)
         self.check_col = col
         self.regex = regex
+        self.use_re2 = use_re2
+        self.use_hyperscan = use_hyperscan
+        self._pattern = re.compile(regex)
     
-    def inspect(self, df, df_desc=None):
-        params = {'col': self.check_col, 'regex': self.regex, 'df_desc': df_desc, 
+    def plan(self, cache):
+        cache.setdefault(('col_format', self.check_col, self.use_re2, self.use_hyperscan), []).append(self._pattern)
+    
+    def shared_inputs(self, df, cache):
+        patterns = cache.get(('col_format', self.check_col, self.use_re2, self.use_hyperscan))
+        if not patterns or self.check_col not in df.columns:
+            return {}
+        key = ('col_format_matched', self.check_col, self.use_re2, self.use_hyperscan)
+        if key not in cache:
+            cache[key] = _match_col(df[self.check_col], patterns, use_re2=self.use_re2, use_hyperscan=self.use_hyperscan)
+        return {'matched': cache[key][patterns.index(self._pattern)]}
+    
+    def inspect(self, df, df_desc=None, matched=None):
+        params = {'col': self.check_col, 'regex': self._pattern, 'df_desc': df_desc, 
                   'inspector_title': self.title, 'inspection_detail': self.detail,
-                  'logger': self.logger, 'fail_sampler': self.fail_sampler}
+                  'logger': self.logger, 'fail_sampler': self.fail_sampler, 'matched': matched,
+                  'use_re2': self.use_re2, 'use_hyperscan': self.use_hyperscan}
         return check_col_format(df, **params)
 
 class GroupAggregateInspector(DataFrameInspector):
@@ -162,7 +393,10 @@ class GroupAggregateInspector(DataFrameInspector):
         self.agg_func_name = agg_func_name
         self.compare_tolerance = compare_tolerance
     
-    def inspect(self, df, df_desc=None):
+    def shared_inputs(self, df, cache):
+        return {'groupby': _cached_groupby(df, self.by, cache)}
+    
+    def inspect(self, df, df_desc=None, groupby=None):
         params = {'by': self.by, 
                   'check_col': self.check_col, 
                   'agg_func': self.agg_func, 
@@ -174,7 +408,8 @@ class GroupAggregateInspector(DataFrameInspector):
                   'inspection_detail': self.detail, 
                   'df_desc': df_desc, 
                   'logger': self.logger, 
-                  'fail_sampler': self.fail_sampler
+                  'fail_sampler': self.fail_sampler,
+                  'groupby': groupby
                  }
         return check_groupby_agg(df, **params)
 
@@ -186,7 +421,10 @@ class IdenticalWithinGroupInspector(DataFrameInspector):
         self.check_col = check_col
         self.tolerance = tolerance
     
-    def inspect(self, df, df_desc=None):
+    def shared_inputs(self, df, cache):
+        return {'groupby': _cached_groupby(df, self.by, cache)}
+    
+    def inspect(self, df, df_desc=None, groupby=None):
         params = {'by': self.by, 
                   'check_col': self.check_col, 
                   'tolerance': self.tolerance,
@@ -194,7 +432,8 @@ class IdenticalWithinGroupInspector(DataFrameInspector):
                   'inspection_detail': self.detail, 
                   'df_desc': df_desc, 
                   'logger': self.logger, 
-                  'fail_sampler': self.fail_sampler
+                  'fail_sampler': self.fail_sampler,
+                  'groupby': groupby
                  }
         return check_groupby_identical(df, **params)
 
@@ -216,5 +455,18 @@ class MissingValuesInspector(DataFrameInspector):
         super().__init__(title=title, detail=detail, logger=logger, fail_sampler=fail_sampler)
         self.cols = cols
     
-    def inspect(self, df, df_desc=None):
-        return check_missing_values(df, cols=self.cols, df_desc=df_desc, inspector_title=self.title, inspection_detail=self.detail, logger=self.logger, fail_sampler=self.fail_sampler)
\ No newline at end of file
+    def plan(self, cache):
+        # collect the union of columns checked by all missing values inspectors; None means all columns
+        if not self.cols:
+            cache['null_mask_cols'] = None
+        elif cache.setdefault('null_mask_cols', {}) is not None:
+            cache['null_mask_cols'].update(dict.fromkeys(self.cols))
+    
+    def shared_inputs(self, df, cache):
+        if 'null_mask' not in cache:
+            cols = cache.get('null_mask_cols')
+            cache['null_mask'] = df.isna() if cols is None else df[list(cols)].isna()
+        return {'null_mask': cache['null_mask']}
+    
+    def inspect(self, df, df_desc=None, null_mask=None):
+        return check_missing_values(df, cols=self.cols, df_desc=df_desc, inspector_title=self.title, inspection_detail=self.detail, logger=self.logger, fail_sampler=self.fail_sampler, null_mask=null_mask)
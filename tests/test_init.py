@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pdqa import FailSampler
+
+
+@pytest.mark.parametrize('df', [
+    pd.DataFrame({'i': [1, 2, 3], 'f': [0.1, np.nan, 2.5], 's': ['a,b', 'é', None],
+                  'b': [True, False, True], 'c': pd.Categorical(['x', None, 'y'])},
+                 index=pd.Index([10, 20, 30], name='id')),
+    # index name clashes with a column
+    pd.DataFrame({'k': [1, 2], 'v': [3, 4]}, index=pd.Index([5, 6], name='k')),
+    # unnamed index, with the columns reset_index() would fall back to
+    pd.DataFrame({'index': [1, 2], 'level_0': [3, 4]}),
+    pd.DataFrame({'v': [1, 2]}, index=pd.MultiIndex.from_tuples([('a', np.nan), ('b', 1.5)], names=['x', None])),
+])
+def test_write_csv_same_as_to_csv(tmp_path, df):
+    for index in [True, False]:
+        FailSampler.write_csv(df, tmp_path / 'fast.csv', index=index)
+        df.to_csv(tmp_path / 'pandas.csv', index=index)
+        assert (tmp_path / 'fast.csv').read_bytes() == (tmp_path / 'pandas.csv').read_bytes()
+
+
+def test_fast_csv_write_sample_with_clashing_index_name(tmp_path):
+    df = pd.DataFrame({'k': [1, 2], 'v': [3, 4]}, index=pd.Index([5, 6], name='k'))
+    FailSampler(save_dir=str(tmp_path), fast_csv=True).write_sample(df, df['v'] > 3, save_filename='fast.csv')
+    assert (tmp_path / 'fast.csv').read_text() == 'k,k,v\n6,2,4\n'
+
+
+def test_fast_csv_falls_back_to_to_csv(tmp_path):
+    df = pd.DataFrame({'d': pd.to_datetime(['2020-01-01', '2020-01-02']), 'v': [1.5, 2.5]})
+    with pytest.raises(ValueError):
+        FailSampler.write_csv(df, tmp_path / 'fast.csv')
+    sampler = FailSampler(save_dir=str(tmp_path), fast_csv=True)
+    sampler.write_sample(df, df['v'] > 0, save_filename='dates.csv', index=False)
+    sampler.write_sample(df[['v']], df['v'] > 0, save_filename='na_rep.csv', index=False, float_format='%.2f')
+    assert (tmp_path / 'dates.csv').read_text() == 'd,v\n2020-01-01,1.5\n2020-01-02,2.5\n'
+    assert (tmp_path / 'na_rep.csv').read_text() == 'v\n1.50\n2.50\n'
+
+
+def test_fast_csv_falls_back_for_float32_and_multilevel_columns(tmp_path):
+    floats = pd.DataFrame({'f32': np.array([0.1], dtype='float32'), 'f16': np.array([0.1], dtype='float16')})
+    multi = pd.DataFrame([[1, 2]], columns=pd.MultiIndex.from_tuples([('a', 'x'), ('a', 'y')]))
+    sampler = FailSampler(save_dir=str(tmp_path), fast_csv=True)
+    for name, df in [('floats', floats), ('multi', multi)]:
+        assert not FailSampler.can_write_csv(df)
+        sampler.write_sample(df, np.ones(len(df), dtype=bool), save_filename=name)
+        df.to_csv(tmp_path / 'pandas.csv')
+        assert (tmp_path / name).read_bytes() == (tmp_path / 'pandas.csv').read_bytes()
@@ -0,0 +1,102 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pdqa import DataFrameInspector, FailSampler, QARoutine
+from pdqa.singledf import (ColumnFormatInspector, IdenticalWithinGroupInspector, MissingValuesInspector, _match_col,
+                            check_groupby_agg, check_groupby_identical)
+
+
+@pytest.mark.parametrize('values, regex', [
+    ([1, 1.0, 2], r'\d+$'),
+    ([True, 1, 0, False], r'True'),
+    (['abc', None, 'de'], r'[a-z]{3}'),
+    (['abc', np.nan, None], r'nan|None'),
+    ([1.5, np.nan, -0.0, 0.0], r'-?\d'),
+    (['x', 1, None, np.nan, True], r'[xT1]'),
+])
+def test_match_col_same_as_astype_str(values, regex):
+    s = pd.Series(values, dtype=object)
+    expected = s.astype(str).str.match(regex).to_numpy(dtype=bool)
+    np.testing.assert_array_equal(_match_col(s, [re.compile(regex)])[0], expected)
+
+
+@pytest.mark.parametrize('value, regex, expected', [
+    ('José', r'\w+$', True),
+    ('١٢٣', r'\d+$', True),
+    ('abc\n', r'abc$', True),
+    ('\xa0x', r'\s', True),
+    ('café', r'[a-z]+\b', False),
+    ('abc\n', r'abc\Z', False),
+    ('aaa', r'a{,3}$', True),
+    ('\x1c', r'\s', True),
+])
+def test_match_col_uses_python_re_semantics_by_default(value, regex, expected):
+    s = pd.Series([value])
+    assert _match_col(s, [re.compile(regex)])[0][0] == expected
+
+
+@pytest.mark.parametrize('value, regex, expected', [
+    ('abc\n', r'abc\Z', False),
+    ('aaa', r'a{,3}$', True),
+    ('a{,3}', r'a{,3}$', False),
+    ('\ud800x', r'.x', True),
+    ('0123456789', r'\d{10}', True),
+])
+def test_match_col_with_hyperscan(value, regex, expected):
+    pytest.importorskip('hyperscan')
+    s = pd.Series([value, 'zzz'])
+    patterns = [re.compile(regex), re.compile('z')]
+    np.testing.assert_array_equal(_match_col(s, patterns, use_hyperscan=True)[:, 0], [expected, False])
+
+
+@pytest.mark.parametrize('tolerance', [None, {'atol': 0.5}])
+def test_check_groupby_identical_missing_values(tolerance):
+    df = pd.DataFrame({'g': [1, 1, 2, 2, 3, 3], 'v': [1.0, np.nan, np.nan, np.nan, 2.0, 2.0]})
+    assert not check_groupby_identical(df, 'g', 'v', tolerance=tolerance)
+    assert check_groupby_identical(df[df['g'] > 1], 'g', 'v', tolerance=tolerance)
+
+
+def test_check_groupby_agg_fail_sample_when_check_col_is_key(tmp_path):
+    df = pd.DataFrame({'k': [1, 1, 2]})
+    assert not check_groupby_agg(df, 'k', 'k', 'count', 1, fail_sampler=FailSampler(save_dir=str(tmp_path)))
+    sample = pd.read_csv(next(tmp_path.iterdir()))
+    assert sample.to_dict('list') == {'k': [1], 'k_agg': [2]}
+
+
+def test_qa_routine_shares_work():
+    df = pd.DataFrame({'g': [1, 1, 2], 'v': [1.0, 1.0, 2.0], 'w': [np.nan, 1.0, 1.0], 'x': [1, 2, 3]})
+
+    class RowCountInspector(DataFrameInspector):
+        def inspect(self, df, df_desc=None):
+            return len(df) == 3
+
+    routine = QARoutine([MissingValuesInspector(['v']), MissingValuesInspector(['w']),
+                         IdenticalWithinGroupInspector(np.array([1, 1, 2]), 'v'),
+                         IdenticalWithinGroupInspector('g', 'v'),
+                         RowCountInspector()])
+    assert routine.run(df) == [True, False, True, True, True]
+
+
+@pytest.mark.parametrize('dtype', ['string[python]', 'string[pyarrow]'])
+def test_match_col_string_dtypes(dtype):
+    s = pd.Series(['0123456789', '12', '0123456789'], dtype=dtype)
+    np.testing.assert_array_equal(_match_col(s, [re.compile(r'\d{10}')])[0], [True, False, True])
+    assert not ColumnFormatInspector('ID', r'\d{10}').inspect(pd.DataFrame({'ID': s}))
+
+
+def test_col_format_with_inferred_string_columns():
+    with pd.option_context('future.infer_string', True):
+        df = pd.DataFrame({'ID': ['0123456789', '12']})
+        assert not ColumnFormatInspector('ID', r'\d{10}').inspect(df)
+        assert ColumnFormatInspector('ID', r'\d+').inspect(df)
+
+
+@pytest.mark.parametrize('use_re2', [False, True])
+def test_match_col_arrow_dtype(use_re2):
+    pa = pytest.importorskip('pyarrow')
+    s = pd.Series(['0123456789', '12'], dtype=pd.ArrowDtype(pa.string()))
+    np.testing.assert_array_equal(_match_col(s, [re.compile(r'\d{10}')], use_re2=use_re2)[0], [True, False])
+    assert not ColumnFormatInspector('ID', r'\d{10}', use_re2=use_re2).inspect(pd.DataFrame({'ID': s}))